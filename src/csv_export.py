@@ -3,6 +3,9 @@ from python_gedcom_2.element.individual import IndividualElement
 import typing
 import csv
 
+# Same columns as the export in main.py, which cannot be imported here without pulling in the GUI
+CSV_HEADER = ["Name", "Gender", "Arbeit", "Geburt", "Tod", "Kinder", "Eltern (V,M)"]
+
 file_path = "The English and British Kings and Queens.ged"
 p: Parser = Parser()
 p.parse_file(file_path)
@@ -15,34 +18,17 @@ for element in p.get_root_child_elements():
 data = []
 #, i.get_death_element()
 for i in invid:
-    if i.get_birth_element():
-        if i.get_birth_element().has_date():
-            birt = str(i.get_birth_element().get_date_element().as_datetime())[:-9]
-        else:
-            birt = None
-    else:
-        birt = None
+    birth = i.get_birth_element()
+    birt = birth.get_date_element().get_date_string() if birth and birth.has_date() else None
 
-    if i.get_death_element():
-        if i.get_death_element().has_date():
-            deat = str(i.get_death_element().get_date_element().as_datetime())[:-9]
-        else:
-            deat = None
-    else:
-        deat = None
+    death = i.get_death_element()
+    deat = death.get_date_element().get_date_string() if death and death.has_date() else None
 
     children = p.get_children(i)
-    child_names = ""
-    for child in children:
-        child_names += child.get_name() +"; "
-    child_names = child_names[:-2] 
+    child_names = "; ".join(child.get_name() for child in children)
 
     parents = p.get_parents(i)
-    parent_str = ""
-    for parent in parents:
-        if parent:
-            parent_str += parent.get_name() + "; "
-    parent_str = parent_str[:-2] 
+    parent_str = "; ".join(parent.get_name() for parent in parents if parent)
 
 
     data.append([i.get_name(), i.get_gender(), i.get_occupation(), birt, deat, child_names, parent_str])
@@ -50,20 +36,17 @@ for i in invid:
 
 print(data)
 
-data_dicts = [dict(zip(["Name", "Gender", "Arbeit", "Geburt", "Tod", "Kinder", "Eltern (V,M)"], row)) for row in data]
-
 
 with open('ances.csv', 'w', newline='', encoding='utf-8') as csvfile:
-    csvwriter = csv.DictWriter(
+    csvwriter = csv.writer(
         csvfile,
-        fieldnames=["Name", "Gender", "Arbeit", "Geburt", "Tod", "Kinder", "Eltern (V,M)"],
         delimiter=',',
         quotechar='"',
         quoting=csv.QUOTE_MINIMAL
     )
     # Write header row
-    csvwriter.writeheader()
+    csvwriter.writerow(CSV_HEADER)
     
     # Write data rows
-    csvwriter.writerows(data_dicts)
+    csvwriter.writerows(data)
 
@@ -8,6 +8,9 @@ from python_gedcom_2.element.element import Element
 
 import csv
 
+# Same columns as csv_export.py, a script that cannot be imported without running the export
+CSV_HEADER = ["Name", "Gender", "Arbeit", "Geburt", "Tod", "Kinder", "Eltern (V,M)"]
+
 
 class MainWindow(tk.Tk):
     def __init__(self, parser: Parser, *args, **kwargs):
@@ -216,45 +219,26 @@ class DisplayFrame(tk.Frame):
 
                 data = []
                 for i in invid:
-                    if i.get_birth_element():
-                        if i.get_birth_element().has_date():
-                            birt = i.get_birth_element().get_date_element().get_value()
-                        else:
-                            birt = None
-                    else:
-                        birt = None
-                    if i.get_death_element():
-                        if i.get_death_element().has_date():
-                            deat = i.get_death_element().get_date_element().get_value()
-                        else:
-                            deat = None
-                    else:
-                        deat = None
+                    birth = i.get_birth_element()
+                    birt = birth.get_date_element().get_value() if birth and birth.has_date() else None
+                    death = i.get_death_element()
+                    deat = death.get_date_element().get_value() if death and death.has_date() else None
                     children = self.controller.parser.get_children(i)
-                    child_names = ""
-                    for child in children:
-                        child_names += child.get_name() +"; "
-                    child_names = child_names[:-2]
+                    child_names = "; ".join(child.get_name() for child in children)
                     parents = self.controller.parser.get_parents(i)
-                    parent_str = ""
-                    for parent in parents:
-                        if parent:
-                            parent_str += parent.get_name() + "; "
-                    parent_str = parent_str[:-2]
+                    parent_str = "; ".join(parent.get_name() for parent in parents if parent)
                     data.append([i.get_name(), i.get_gender(), i.get_occupation(), birt, deat, child_names, parent_str])
 
-                data_dicts = [dict(zip(["Name", "Gender", "Arbeit", "Geburt", "Tod", "Kinder", "Eltern (V,M)"], row)) for row in data]
                 with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
-                    csvwriter = csv.DictWriter(
+                    csvwriter = csv.writer(
                         csvfile,
-                        fieldnames=["Name", "Gender", "Arbeit", "Geburt", "Tod", "Kinder", "Eltern (V,M)"],
                         delimiter=',',
                         quotechar='"',
                         quoting=csv.QUOTE_MINIMAL
                     )
-                    csvwriter.writeheader()
+                    csvwriter.writerow(CSV_HEADER)
 
-                    csvwriter.writerows(data_dicts)
+                    csvwriter.writerows(data)
 
                 messagebox.showinfo("Exportieren", f"Datei erfolgreich exportiert nach {file_path}")
             except Exception as e:
@@ -348,8 +332,8 @@ class DisplayFrame(tk.Frame):
             start_x += cw + self.horizontal_gap
 
     def object_click_event(self, event, item_id):
-        if item_id in self.objects:
-            pointer = self.objects[item_id]
+        pointer = self.objects.get(item_id)
+        if pointer is not None:
             person = self.controller.parser.get_element_by_pointer(pointer)
             EditPopup(person, self.controller)
 
@@ -447,6 +431,10 @@ class EditPopup(tk.Toplevel):
                 element.set_value(entry.get())
                 changed = True
 
+        if changed:
+            self.person.invalidate_cache()
+            self.controller.parser.invalidate_cache()
+
         if changed and isinstance(self.controller.current_frame, DisplayFrame):
             self.controller.show_frame(DisplayFrame, start_person_name=self.controller.current_frame.start_person_name)
         self.destroy()
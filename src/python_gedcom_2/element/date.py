@@ -1,7 +1,9 @@
 """GEDCOM element consisting of tag `gedcom.tags.GEDCOM_TAG_DATE`"""
 
+from calendar import monthrange
 from datetime import datetime
 from enum import Enum
+import re as regex
 from typing import List
 
 from python_gedcom_2 import tags
@@ -18,6 +20,14 @@ approximate_prefixes: List[str]  = ["ABT", "CAL", "EST", "INT"]
 
 range_prefixes: List[str]  = ["BET", "AFT", "BEF"]
 
+# `[day] [month] year` as accepted by `DateElement.__parse_date_string()`, the day requires a month
+_match_simple_date = regex.compile(r'^(?:(?:(\d{1,2}) )?([A-Za-z]{3}) )?(\d{4})$').match
+
+_month_numbers = {
+    "JAN": 1, "FEB": 2, "MAR": 3, "APR": 4, "MAY": 5, "JUN": 6,
+    "JUL": 7, "AUG": 8, "SEP": 9, "OCT": 10, "NOV": 11, "DEC": 12,
+}
+
 
 class DateType(Enum):
     UNKNOWN = 0,
@@ -39,6 +49,8 @@ class DateType(Enum):
         return DateType.EXACT
 
 class DateElement(Element):
+    __slots__ = ('date_type',)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.date_type = DateType.from_date_value(self.get_value())
@@ -61,6 +73,30 @@ class DateElement(Element):
 
         raise Exception(f"DateElement '{self}' of type '{self.date_type}' cannot be represented as a single date.")
 
+    def get_date_string(self) -> str:
+        """Returns the date of this element formatted as `YYYY-MM-DD`
+
+        Plain dates like `1 JAN 1900`, `JAN 1900` or `1900` are converted directly,
+        everything else goes through `as_datetime()`.
+        """
+        if self.date_type == DateType.EXACT:
+            value = self.get_value()
+        elif self.date_type == DateType.APPROXIMATE:
+            value = self.get_value()[3:].strip()
+        else:
+            value = None
+
+        simple_date = _match_simple_date(value) if value is not None else None
+        if simple_date is not None:
+            day, month, year = simple_date.groups()
+            year = int(year)
+            month = _month_numbers.get(month.upper()) if month is not None else 1
+            day = int(day) if day is not None else 1
+            if year > 0 and month is not None and 0 < day <= monthrange(year, month)[1]:
+                return f"{year:04d}-{month:02d}-{day:02d}"
+
+        return self.as_datetime().date().isoformat()
+
     def is_unknown(self) -> bool:
         return self.get_value().strip() == "Y"
 
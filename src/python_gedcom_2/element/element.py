@@ -36,6 +36,9 @@ class Element:
     Tags available to an element are seen here: `gedcom.tags`
     """
 
+    # Files easily contain tens of thousands of elements, slots keep each of them small
+    __slots__ = ('__level', '__pointer', '__tag', '__value', '__crlf', '__children', '__parent')
+
     def __init__(self, level, pointer, tag, value, crlf="\n", multi_line=True):
         # basic element info
         self.__level = level
@@ -249,10 +252,11 @@ class Element:
         return result
 
     def get_child_element_by_tag(self, tag: str):
-        if self.is_tag_present(tag):
-            for child in self.get_child_elements():
-                if child.get_tag() == tag:
-                    return child
+        """Returns the first direct child element with the given tag, or None if there is none
+        """
+        for child in self.get_child_elements():
+            if child.get_tag() == tag:
+                return child
         return None
 
     def __str__(self):
@@ -10,6 +10,8 @@ class EventDetail(Element):
     NOTE: This is different from an event element, which is a legitimate GEDCOM tag and has its own rules.
     """
 
+    __slots__ = ()
+
     __family_event_tags = ["ANUL", "CENS", "DIV", "DIVF", "ENGA", "MARB", "MARC", "MARL", "MARS", "MARR"]
     __individual_event_tags = ["BIRT", "CHR", "DEAT", "ADOP", 'BURI', 'CREM', 'BAPM', 'BARM', 'BASM', 'BLES', 'CHRA', 'CONF', 'FCOM', 'ORDN', 'NATU', 'EMIG', 'IMMI', 'CENS', 'PROB', 'WILL', 'GRAD', 'RETI']
 
@@ -11,6 +11,7 @@ class NotAnActualFamilyError(Exception):
 
 
 class FamilyElement(Element):
+    __slots__ = ()
 
     def get_tag(self):
         return python_gedcom_2.tags.GEDCOM_TAG_FAMILY
@@ -33,12 +34,14 @@ class FamilyElement(Element):
     def get_husband_pointer(self) -> str:
         """Returns the pointer to the husband individual or an empty string if the family has none
         """
-        return self.get_child_element_by_tag(python_gedcom_2.tags.GEDCOM_TAG_HUSBAND).get_value() if self.has_husband() else ""
+        husband = self.get_child_element_by_tag(python_gedcom_2.tags.GEDCOM_TAG_HUSBAND)
+        return husband.get_value() if husband is not None else ""
 
     def get_wife_pointer(self) -> str:
         """Returns the pointer to the wife individual or an empty string if the family has none
         """
-        return self.get_child_element_by_tag(python_gedcom_2.tags.GEDCOM_TAG_WIFE).get_value() if self.has_wife() else ""
+        wife = self.get_child_element_by_tag(python_gedcom_2.tags.GEDCOM_TAG_WIFE)
+        return wife.get_value() if wife is not None else ""
 
     def get_children_pointers(self) -> List[str]:
         """Returns a list of direct children of this family. This function is not recursive.
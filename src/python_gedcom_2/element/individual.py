@@ -14,7 +14,37 @@ class NotAnActualIndividualError(Exception):
     pass
 
 
+# Marks a cached value that has not been looked up yet, since None is a valid result
+_NOT_CACHED = object()
+
+
 class IndividualElement(Element):
+    __slots__ = ('_name', '_gender', '_occupation', '_birth', '_death')
+
+    def __init__(self, *args, **kwargs):
+        # Set before the base constructor, which may already add child elements
+        self.invalidate_cache()
+        super().__init__(*args, **kwargs)
+
+    def invalidate_cache(self):
+        """Empties the cached name, gender, occupation, birth and death of this individual
+
+        Adding or removing child elements of this individual does so automatically. After changing
+        the value of one of its child elements, call this method to let the getters return updated data.
+        """
+        self._name = _NOT_CACHED
+        self._gender = _NOT_CACHED
+        self._occupation = _NOT_CACHED
+        self._birth = _NOT_CACHED
+        self._death = _NOT_CACHED
+
+    def add_child_element(self, element):
+        self.invalidate_cache()
+        return super().add_child_element(element)
+
+    def remove_child_element(self, element: Element):
+        self.invalidate_cache()
+        super().remove_child_element(element)
 
     def get_tag(self):
         return python_gedcom_2.tags.GEDCOM_TAG_INDIVIDUAL
@@ -52,8 +82,16 @@ class IndividualElement(Element):
     def get_name_as_tuple(self) -> Tuple[str, str]:
         """Returns an individual's names as a tuple: (`str` given_name, `str` surname)
         If this person has a suffix (e.g., 'Jr') it gets removed entirely.
+        The result is cached, see `invalidate_cache()`.
         :rtype: tuple
         """
+        if self._name is _NOT_CACHED:
+            self._name = self.__find_name_as_tuple()
+        return self._name
+
+    def __find_name_as_tuple(self) -> Tuple[str, str]:
+        """Looks up the names returned by `get_name_as_tuple()` without consulting the cache
+        """
         given_name = ""
         surname = ""
 
@@ -118,13 +156,9 @@ class IndividualElement(Element):
         """Returns the gender of a person in string format
         :rtype: str
         """
-        gender = ""
-
-        for child in self.get_child_elements():
-            if child.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_SEX:
-                gender = child.get_value()
-
-        return gender
+        if self._gender is _NOT_CACHED:
+            self._gender = self.__find_last_value(python_gedcom_2.tags.GEDCOM_TAG_SEX)
+        return self._gender
 
     def get_census_data(self):
         """Returns a list of censuses of an individual formatted as tuples: (`str` date, `str` place, `list` sources)
@@ -157,19 +191,34 @@ class IndividualElement(Element):
     def get_occupation(self) -> str:
         """Returns the occupation of a person
         """
-        occupation = ""
+        if self._occupation is _NOT_CACHED:
+            self._occupation = self.__find_last_value(python_gedcom_2.tags.GEDCOM_TAG_OCCUPATION)
+        return self._occupation
+
+    def __find_last_value(self, tag: str) -> str:
+        """Returns the value of the last child element with the given tag, or an empty string if there is none
+        """
+        value = ""
 
         for child in self.get_child_elements():
-            if child.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_OCCUPATION:
-                occupation = child.get_value()
+            if child.get_tag() == tag:
+                value = child.get_value()
 
-        return occupation
+        return value
 
     def get_birth_element(self) -> BirthElement | None:
-        return self.get_child_element_by_tag(python_gedcom_2.tags.GEDCOM_TAG_BIRTH)
+        """Returns the birth element of this individual, looked up once and cached until the children change
+        """
+        if self._birth is _NOT_CACHED:
+            self._birth = self.get_child_element_by_tag(python_gedcom_2.tags.GEDCOM_TAG_BIRTH)
+        return self._birth
 
     def get_death_element(self) -> DeathElement | None:
-        return self.get_child_element_by_tag(python_gedcom_2.tags.GEDCOM_TAG_DEATH)
+        """Returns the death element of this individual, looked up once and cached until the children change
+        """
+        if self._death is _NOT_CACHED:
+            self._death = self.get_child_element_by_tag(python_gedcom_2.tags.GEDCOM_TAG_DEATH)
+        return self._death
 
     def get_events(self) -> List[EventDetail]:
         return [child for child in self.get_child_elements() if isinstance(child, EventDetail)]
@@ -180,9 +229,8 @@ class IndividualElement(Element):
     def get_parent_family_pointer(self) -> str | None:
         """Returns the pointer to the family that this individual is a child of
         """
-        if self.is_child_in_a_family():
-            return self.get_child_element_by_tag(python_gedcom_2.tags.GEDCOM_TAG_FAMILY_CHILD).get_value()
-        return None
+        family_child = self.get_child_element_by_tag(python_gedcom_2.tags.GEDCOM_TAG_FAMILY_CHILD)
+        return family_child.get_value() if family_child is not None else None
 
     def get_spouse_families_pointer(self) -> List[str]:
         """Returns the pointer to the family that this individual is a child of
@@ -4,4 +4,4 @@ from python_gedcom_2.element.event_detail import EventDetail
 
 
 class MarriageLicenseElement(EventDetail):
-    pass
+    __slots__ = ()
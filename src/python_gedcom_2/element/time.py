@@ -3,6 +3,8 @@ from python_gedcom_2.element.element import Element
 
 
 class TimeElement(Element):
+    __slots__ = ()
+
     def as_datetime(self) -> datetime:
         return datetime.strptime(self.get_value(), "%H:%M:%S.%f")
 
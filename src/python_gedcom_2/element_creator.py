@@ -69,8 +69,8 @@ class ElementCreator:
             python_gedcom_2.tags.GEDCOM_TAG_WILL: "WillElement",
         }
 
-        if tag in tag_element_dict:
-            class_name_in_string_form = tag_element_dict[tag]
+        class_name_in_string_form = tag_element_dict.get(tag)
+        if class_name_in_string_form is not None:
             file_name_without_extension_for_this_class = cls._get_file_name_from_class_name(class_name_in_string_form)
             module = importlib.import_module("python_gedcom_2.element." + file_name_without_extension_for_this_class)
             class_ = getattr(module, class_name_in_string_form)
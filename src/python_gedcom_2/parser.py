@@ -4,6 +4,7 @@ which can in return be manipulated.
 """
 
 import re as regex
+from collections import deque
 from sys import version_info, stdout
 from typing import List, Tuple
 
@@ -20,6 +21,30 @@ FAMILY_MEMBERS_TYPE_HUSBAND = python_gedcom_2.tags.GEDCOM_TAG_HUSBAND
 FAMILY_MEMBERS_TYPE_PARENTS = "PARENTS"
 FAMILY_MEMBERS_TYPE_WIFE = python_gedcom_2.tags.GEDCOM_TAG_WIFE
 
+FILE_BUFFER_SIZE = 1 << 20
+
+# Level must start with non-negative int, no leading zeros.
+LEVEL_REGEX = '^(0|[1-9]+[0-9]*) '
+
+# Pointer optional, if it exists it must be flanked by `@`
+POINTER_REGEX = '(@[^@]+@ |)'
+
+# Tag must be an alphanumeric string
+TAG_REGEX = '([A-Za-z0-9_]+)'
+
+# Value optional, consists of anything after a space to end of line
+VALUE_REGEX = '( [^\n\r]*|)'
+
+# End of line defined by `\n` or `\r`
+END_OF_LINE_REGEX = '([\r\n]{1,2})'
+
+# Compiled once at import time, `Parser.parse_line()` runs for every line of a file
+_match_line = regex.compile(LEVEL_REGEX + POINTER_REGEX + TAG_REGEX + VALUE_REGEX + END_OF_LINE_REGEX).match
+_match_last_line = regex.compile(LEVEL_REGEX + POINTER_REGEX + TAG_REGEX + VALUE_REGEX).match
+_match_cont_line = regex.compile('([^\n\r]*|)' + END_OF_LINE_REGEX).match
+
+_TAG_CHARACTERS = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_')
+
 
 class GedcomFormatViolationError(Exception):
     pass
@@ -45,25 +70,30 @@ class Parser:
     def __init__(self):
         self.__element_list = []
         self.__element_dictionary = {}
+        self.__parents_cache: dict[str, Tuple[IndividualElement | None, IndividualElement | None]] = {}
+        self.__children_cache: dict[str, Tuple[IndividualElement, ...]] = {}
+        self.__family_index: dict[str, dict[str, List[FamilyElement]]] = {}
         self.__root_element = RootElement()
 
     def invalidate_cache(self):
         """Empties the element list and dictionary to cause `gedcom.parser.Parser.get_element_list()`
         and `gedcom.parser.Parser.get_element_dictionary()` to return updated data.
 
+        The cached results of `gedcom.parser.Parser.get_parents()` and `gedcom.parser.Parser.get_children()`
+        and the family index behind `gedcom.parser.Parser.get_families()` are dropped as well.
+
         The update gets deferred until each of the methods actually gets called.
         """
         self.__element_list = []
         self.__element_dictionary = {}
+        self.__parents_cache = {}
+        self.__children_cache = {}
+        self.__family_index = {}
 
     def get_element_by_pointer(self, pointer: str) -> Element | None:
         """Returns the element that has the provided pointer. Returns None if no Element with that pointer doesn't exist.
         """
-        element_dictionary = self.get_element_dictionary()
-        if pointer not in element_dictionary:
-            return None
-        else:
-            return element_dictionary[pointer]
+        return self.get_element_dictionary().get(pointer)
 
     def get_element_list(self) -> List[Element]:
         """Returns a list containing all elements from within the GEDCOM file
@@ -78,8 +108,13 @@ class Parser:
         the hierarchical GEDCOM tree, unless you rarely modify the database.
         """
         if not self.__element_list:
-            for element in self.get_root_child_elements():
-                self.__build_list(element, self.__element_list)
+            element_list = self.__element_list
+            # Children are pushed in reverse so they are popped in file order
+            stack = self.get_root_child_elements()[::-1]
+            while stack:
+                element = stack.pop()
+                element_list.append(element)
+                stack.extend(reversed(element.get_child_elements()))
         return self.__element_list
 
     def get_element_dictionary(self) -> dict[str, Element]:
@@ -88,9 +123,9 @@ class Parser:
         Only elements identified by a pointer are listed in the dictionary.
         The keys for the dictionary are the pointers.
 
-        This dictionary gets generated on-the-fly, but gets cached. If the
+        This dictionary gets filled while parsing and is cached. If the
         database was modified, you should call `invalidate_cache()` once to let
-        this method return updated data.
+        this method regenerate it from the root elements.
         """
         if not self.__element_dictionary:
             self.__element_dictionary = {
@@ -122,107 +157,84 @@ class Parser:
         :type file_path: str
         :type strict: bool
         """
-        with open(file_path, 'rb') as gedcom_stream:
+        # Decoding is left to the text stream, which strips a leading byte order mark and keeps line breaks intact.
+        # GEDCOM files are read front to back, a large buffer keeps the number of reads low.
+        with open(file_path, 'r', buffering=FILE_BUFFER_SIZE, encoding='utf-8-sig', newline='\n') as gedcom_stream:
             self.parse_stream(gedcom_stream, strict)
 
     def parse_stream(self, gedcom_stream, strict=True):
         """Parses a stream, or an array of lines, as GEDCOM 5.5 formatted data
-        :type gedcom_stream: a file stream, or str array of lines with new line at the end
+        :type gedcom_stream: a text file stream, or str array of lines with new line at the end
         :type strict: bool
         """
-        self.invalidate_cache()
-        self.__root_element = RootElement()
-
-        line_number = 1
-        last_element = self.get_root_element()
-
-        for line in gedcom_stream:
-            last_element = self.parse_line(line_number, line.decode('utf-8-sig'), last_element, strict)
-            line_number += 1
+        self.__parse_lines(gedcom_stream, strict)
 
     def parse(self, string: str, strict=True):
         """Parses a stream, or an array of lines, as GEDCOM 5.5 formatted data"""
-        self.invalidate_cache()
-        self.__root_element = RootElement()
-
-        line_number = 1
-        last_element = self.get_root_element()
-
-        for line in string.strip().split("\n"):
-            last_element = self.parse_line(line_number, line, last_element, strict)
-            line_number += 1
+        self.__parse_lines(string.strip().split("\n"), strict)
 
     # Private methods
 
     @staticmethod
-    def parse_line(line_number: int, line: str, last_element: Element, strict=True) -> Element:
+    def parse_line(line_number: int, line: str, last_element: Element, strict=True,
+                   level_stack: List[Element] | None = None) -> Element:
         """Parse a line from a GEDCOM 5.5 formatted document
 
         Each line should have the following (bracketed items optional):
         level + ' ' + [pointer + ' ' +] tag + [' ' + line_value]
-        """
 
-        # Level must start with non-negative int, no leading zeros.
-        level_regex = '^(0|[1-9]+[0-9]*) '
-
-        # Pointer optional, if it exists it must be flanked by `@`
-        pointer_regex = '(@[^@]+@ |)'
-
-        # Tag must be an alphanumeric string
-        tag_regex = '([A-Za-z0-9_]+)'
-
-        # Value optional, consists of anything after a space to end of line
-        value_regex = '( [^\n\r]*|)'
-
-        # End of line defined by `\n` or `\r`
-        end_of_line_regex = '([\r\n]{1,2})'
+        If given, `level_stack` holds the latest element of each level, shifted by one so that
+        the root element is at index 0 and `last_element` is the last entry. The parent is then
+        taken from it directly instead of walking up from `last_element`, and it gets updated.
+        """
 
-        # Complete regex
-        gedcom_line_regex = level_regex + pointer_regex + tag_regex + value_regex + end_of_line_regex
-        regex_match = regex.match(gedcom_line_regex, line)
+        line_parts = Parser.__split_line(line)
 
-        if regex_match is None:
-            if strict:
-                error_message = (f"Line <{line_number}:{line}> of document violates GEDCOM format 5.5"
-                                 + "\nSee: https://chronoplexsoftware.com/gedcomvalidator/gedcom/gedcom-5.5.pdf")
-                raise GedcomFormatViolationError(error_message)
-            else:
-                # Quirk check - see if this is a line without a CRLF (which could be the last line)
-                last_line_regex = level_regex + pointer_regex + tag_regex + value_regex
-                regex_match = regex.match(last_line_regex, line)
-                if regex_match is not None:
-                    line_parts = regex_match.groups()
-
-                    level = int(line_parts[0])
-                    pointer = line_parts[1].rstrip(' ')
-                    tag = line_parts[2]
-                    value = line_parts[3].strip()
-                    crlf = '\n'
-                else:
-                    # Quirk check - Sometimes a gedcom has a text field with a CR.
-                    # This creates a line without the standard level and pointer.
-                    # If this is detected then turn it into a CONC or CONT.
-                    line_regex = '([^\n\r]*|)'
-                    cont_line_regex = line_regex + end_of_line_regex
-                    regex_match = regex.match(cont_line_regex, line)
-                    line_parts = regex_match.groups()
-                    level = last_element.get_level()
-                    tag = last_element.get_tag()
-                    pointer = None
-                    value = line_parts[0].strip()
-                    crlf = line_parts[1]
-                    if tag != python_gedcom_2.tags.GEDCOM_TAG_CONTINUED and tag != python_gedcom_2.tags.GEDCOM_TAG_CONCATENATION:
-                        # Increment level and change this line to a CONC
-                        level += 1
-                        tag = python_gedcom_2.tags.GEDCOM_TAG_CONCATENATION
+        if line_parts is not None:
+            level, pointer, tag, value, crlf = line_parts
         else:
-            line_parts = regex_match.groups()
+            # Anything the plain tokenizer does not understand goes through the regular expressions
+            regex_match = _match_line(line)
+
+            if regex_match is None:
+                if strict:
+                    error_message = (f"Line <{line_number}:{line}> of document violates GEDCOM format 5.5"
+                                     + "\nSee: https://chronoplexsoftware.com/gedcomvalidator/gedcom/gedcom-5.5.pdf")
+                    raise GedcomFormatViolationError(error_message)
+                else:
+                    # Quirk check - see if this is a line without a CRLF (which could be the last line)
+                    regex_match = _match_last_line(line)
+                    if regex_match is not None:
+                        line_parts = regex_match.groups()
+
+                        level = int(line_parts[0])
+                        pointer = line_parts[1].rstrip(' ')
+                        tag = line_parts[2]
+                        value = line_parts[3].strip()
+                        crlf = '\n'
+                    else:
+                        # Quirk check - Sometimes a gedcom has a text field with a CR.
+                        # This creates a line without the standard level and pointer.
+                        # If this is detected then turn it into a CONC or CONT.
+                        regex_match = _match_cont_line(line)
+                        line_parts = regex_match.groups()
+                        level = last_element.get_level()
+                        tag = last_element.get_tag()
+                        pointer = None
+                        value = line_parts[0].strip()
+                        crlf = line_parts[1]
+                        if tag != python_gedcom_2.tags.GEDCOM_TAG_CONTINUED and tag != python_gedcom_2.tags.GEDCOM_TAG_CONCATENATION:
+                            # Increment level and change this line to a CONC
+                            level += 1
+                            tag = python_gedcom_2.tags.GEDCOM_TAG_CONCATENATION
+            else:
+                line_parts = regex_match.groups()
 
-            level = int(line_parts[0])
-            pointer = line_parts[1].rstrip(' ')
-            tag = line_parts[2]
-            value = line_parts[3].strip()
-            crlf = line_parts[4]
+                level = int(line_parts[0])
+                pointer = line_parts[1].rstrip(' ')
+                tag = line_parts[2]
+                value = line_parts[3].strip()
+                crlf = line_parts[4]
 
         # Check level: should never be more than one higher than previous line.
         if level > last_element.get_level() + 1:
@@ -233,25 +245,79 @@ class Parser:
 
         element = ElementCreator.create_element(level, pointer, tag, value, crlf, is_multiline=False)
 
-        # Start with last element as parent, back up if necessary.
-        parent_element = last_element
+        if level_stack is not None:
+            parent_element = level_stack[level]
+            del level_stack[level + 1:]
+            level_stack.append(element)
+        else:
+            # Start with last element as parent, back up if necessary.
+            parent_element = last_element
+            parent_level = level - 1
 
-        while parent_element.get_level() > level - 1:
-            parent_element = parent_element.get_parent_element()
+            while parent_element.get_level() > parent_level:
+                parent_element = parent_element.get_parent_element()
 
         # Add child to parent & parent to child.
         parent_element.add_child_element(element)
 
         return element
 
-    def __build_list(self, element, element_list):
-        """Recursively add elements to a list containing elements
-        :type element: Element
-        :type element_list: list of Element
+    def __parse_lines(self, lines, strict=True):
+        """Replaces the current tree with the elements parsed from the given lines
+
+        Logical records with a pointer are added to the element dictionary as they are parsed,
+        so `gedcom.parser.Parser.get_element_dictionary()` does not need to scan the tree afterwards.
         """
-        element_list.append(element)
-        for child in element.get_child_elements():
-            self.__build_list(child, element_list)
+        self.invalidate_cache()
+        self.__root_element = RootElement()
+
+        element_dictionary = self.__element_dictionary
+        line_number = 1
+        last_element = self.get_root_element()
+        level_stack = [last_element]
+
+        for line in lines:
+            last_element = self.parse_line(line_number, line, last_element, strict, level_stack)
+            if last_element.get_level() == 0 and last_element.get_pointer():
+                element_dictionary[last_element.get_pointer()] = last_element
+            line_number += 1
+
+    @staticmethod
+    def __split_line(line: str) -> Tuple[int, str, str, str, str] | None:
+        """Splits a well-formed GEDCOM line into (level, pointer, tag, value, crlf) without using regular expressions
+
+        Returns None if the line does not strictly follow `level [pointer] tag [value]` ending with a line break,
+        in which case `gedcom.parser.Parser.parse_line()` falls back to the regular expressions.
+        """
+        content = line.rstrip('\r\n')
+        crlf = line[len(content):]
+        if not 0 < len(crlf) <= 2 or '\r' in content or '\n' in content:
+            return None
+
+        parts = content.split(' ', 2)
+        if len(parts) < 2:
+            return None
+
+        level = parts[0]
+        if not (level.isascii() and level.isdigit()) or (level[0] == '0' and len(level) > 1):
+            return None
+
+        pointer = parts[1]
+        if len(pointer) > 2 and pointer[0] == '@' and pointer[-1] == '@' and '@' not in pointer[1:-1]:
+            if len(parts) < 3:
+                return None
+            rest = parts[2].split(' ', 1)
+            tag = rest[0]
+            value = rest[1] if len(rest) > 1 else ''
+        else:
+            pointer = ''
+            tag = parts[1]
+            value = parts[2] if len(parts) > 2 else ''
+
+        if not tag or not _TAG_CHARACTERS.issuperset(tag):
+            return None
+
+        return int(level), pointer, tag, value.strip(), crlf
 
     # Methods for analyzing individuals and relationships between individuals
 
@@ -271,9 +337,10 @@ class Parser:
                     date = ''
                     place = ''
                     for marriage_data in family_data.get_child_elements():
-                        if marriage_data.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_DATE:
+                        tag = marriage_data.get_tag()
+                        if tag == python_gedcom_2.tags.GEDCOM_TAG_DATE:
                             date = marriage_data.get_value()
-                        if marriage_data.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_PLACE:
+                        if tag == python_gedcom_2.tags.GEDCOM_TAG_PLACE:
                             place = marriage_data.get_value()
                     marriages.append((date, place))
         return marriages
@@ -284,71 +351,136 @@ class Parser:
         family_type can be `gedcom.tags.GEDCOM_TAG_FAMILY_SPOUSE` (families where the individual is a spouse) or
         `gedcom.tags.GEDCOM_TAG_FAMILY_CHILD` (families where the individual is a child). If a value is not
         provided, `gedcom.tags.GEDCOM_TAG_FAMILY_SPOUSE` is default value.
+
+        Spouse and child families are looked up in an index covering all individuals,
+        see `gedcom.parser.Parser.invalidate_cache()`.
         """
         if not isinstance(individual, IndividualElement):
             raise NotAnActualIndividualError(
                 "Operation only valid for elements with %s tag" % python_gedcom_2.tags.GEDCOM_TAG_INDIVIDUAL
             )
 
+        families_by_individual = self.__get_family_index().get(family_type)
+        if families_by_individual is not None:
+            # A copy, so callers cannot change the shared index
+            return list(families_by_individual.get(individual.get_pointer(), ()))
+
         families = []
         element_dictionary = self.get_element_dictionary()
 
         for child_element in individual.get_child_elements():
-            is_family = (child_element.get_tag() == family_type
-                         and child_element.get_value() in element_dictionary)
-            if is_family:
-                families.append(element_dictionary[child_element.get_value()])
+            if child_element.get_tag() == family_type:
+                family = element_dictionary.get(child_element.get_value())
+                if family is not None:
+                    families.append(family)
 
         return families
 
+    def __get_family_index(self) -> dict[str, dict[str, List[FamilyElement]]]:
+        """Returns the families each individual links to, by family type and then by pointer of the individual
+
+        The index gets built in a single pass over all individuals the first time it is needed
+        and is cached until `gedcom.parser.Parser.invalidate_cache()` gets called.
+        """
+        if not self.__family_index:
+            element_dictionary = self.get_element_dictionary()
+            family_index: dict[str, dict[str, List[FamilyElement]]] = {
+                python_gedcom_2.tags.GEDCOM_TAG_FAMILY_SPOUSE: {},
+                python_gedcom_2.tags.GEDCOM_TAG_FAMILY_CHILD: {},
+            }
+
+            for element in self.get_root_child_elements():
+                if not isinstance(element, IndividualElement):
+                    continue
+                for child_element in element.get_child_elements():
+                    families_by_individual = family_index.get(child_element.get_tag())
+                    if families_by_individual is not None:
+                        family = element_dictionary.get(child_element.get_value())
+                        if family is not None:
+                            families_by_individual.setdefault(element.get_pointer(), []).append(family)
+
+            self.__family_index = family_index
+
+        return self.__family_index
+
     def get_ancestors(self, individual: IndividualElement) -> List[IndividualElement]:
-        """Return elements corresponding to ancestors of an individual
+        """Return elements corresponding to ancestors of an individual, closest generations first
+
+        Each ancestor is listed once, even if it can be reached through several lines of descent.
         """
         if not isinstance(individual, IndividualElement):
             raise NotAnActualIndividualError(
                 "Operation only valid for elements with %s tag" % python_gedcom_2.tags.GEDCOM_TAG_INDIVIDUAL
             )
 
-        parents = self.get_parents(individual)
-        ancestors = []
-        ancestors.extend(parents)
+        ancestors: List[IndividualElement] = []
+        seen = {individual.get_pointer()}
+        queue = deque([individual])
 
-        for parent in parents:
-            ancestors.extend(self.get_ancestors(parent))
+        while queue:
+            for parent in self.get_parents(queue.popleft()):
+                if isinstance(parent, IndividualElement) and parent.get_pointer() not in seen:
+                    seen.add(parent.get_pointer())
+                    ancestors.append(parent)
+                    queue.append(parent)
 
         return ancestors
 
     def get_parents(self, individual: IndividualElement) -> Tuple[IndividualElement | None, IndividualElement | None]:
         """Return elements corresponding to parents of an individual. (husband, wife)
+
+        Results are cached per individual until `gedcom.parser.Parser.invalidate_cache()` gets called.
         """
         if not isinstance(individual, IndividualElement):
             raise NotAnActualIndividualError(
                 "Operation only valid for elements with %s tag" % python_gedcom_2.tags.GEDCOM_TAG_INDIVIDUAL
             )
 
-        if not individual.is_child_in_a_family():
+        cache_key = individual.get_pointer()
+        parents = self.__parents_cache.get(cache_key)
+        if parents is not None:
+            return parents
+
+        parents = self.__find_parents(individual)
+        self.__parents_cache[cache_key] = parents
+        return parents
+
+    def __find_parents(self, individual: IndividualElement) -> Tuple[IndividualElement | None, IndividualElement | None]:
+        """Looks up the parents of an individual without consulting the cache
+        """
+        family_pointer = individual.get_parent_family_pointer()
+        if family_pointer is None:
             return None, None
 
-        family = self.get_element_by_pointer(individual.get_parent_family_pointer())
+        family = self.get_element_by_pointer(family_pointer)
 
         if not isinstance(family, FamilyElement):
             return None, None
 
-        husband: IndividualElement | None = self.get_element_by_pointer(family.get_husband_pointer()) if family.has_husband() else None
-        wife: IndividualElement | None = self.get_element_by_pointer(family.get_wife_pointer()) if family.has_wife() else None
+        husband_pointer = family.get_husband_pointer()
+        wife_pointer = family.get_wife_pointer()
+        husband: IndividualElement | None = self.get_element_by_pointer(husband_pointer) if husband_pointer else None
+        wife: IndividualElement | None = self.get_element_by_pointer(wife_pointer) if wife_pointer else None
 
         return husband, wife
 
     def get_children(self, individual: IndividualElement) -> List[IndividualElement]:
         """
         Return a list of children of an individual that are directly related and not adopted.
+
+        Results are cached per individual until `gedcom.parser.Parser.invalidate_cache()` gets called.
         """
         if not isinstance(individual, IndividualElement):
             raise NotAnActualIndividualError(
                 f"Operation only valid for elements with {python_gedcom_2.tags.GEDCOM_TAG_INDIVIDUAL} tag"
             )
 
-        children: List[IndividualElement] = []
+        cache_key = individual.get_pointer()
+        cached_children = self.__children_cache.get(cache_key)
+        if cached_children is not None:
+            return list(cached_children)
+
+        children = []
         families = self.get_families(individual, python_gedcom_2.tags.GEDCOM_TAG_FAMILY_SPOUSE)
 
         for family in families:
@@ -357,27 +489,37 @@ class Parser:
                 if isinstance(child, IndividualElement):
                     children.append(child)
 
+        # Stored as a tuple, callers get their own list and cannot change the cached result
+        self.__children_cache[cache_key] = tuple(children)
         return children
 
     def get_descendants(self, individual: IndividualElement) -> List[IndividualElement]:
+        """Return elements corresponding to descendants of an individual, closest generations first
+
+        Each descendant is listed once, even if it can be reached through several lines of descent.
+        """
         if not isinstance(individual, IndividualElement):
             raise NotAnActualIndividualError(
                 "Operation only valid for elements with %s tag" % python_gedcom_2.tags.GEDCOM_TAG_INDIVIDUAL
             )
 
         descendants: List[IndividualElement] = []
-        families = self.get_families(individual, python_gedcom_2.tags.GEDCOM_TAG_FAMILY_SPOUSE)
-        for family in families:
-            for pointer in family.get_children_pointers():
-                child = self.get_element_by_pointer(pointer)
-                if isinstance(child, IndividualElement):
+        seen = {individual.get_pointer()}
+        queue = deque([individual])
+
+        while queue:
+            for child in self.get_children(queue.popleft()):
+                if child.get_pointer() not in seen:
+                    seen.add(child.get_pointer())
                     descendants.append(child)
-                    descendants.extend(self.get_descendants(child))
+                    queue.append(child)
 
         return descendants
 
     def find_path_to_ancestor(self, descendant: IndividualElement, ancestor: IndividualElement, path=None) -> List[IndividualElement] | None:
-        """Return path from descendant to ancestor
+        """Return the shortest path from descendant to ancestor, or None if ancestor is not an ancestor of descendant
+
+        If a path is given, it has to end with descendant and the result continues it.
         """
         if not isinstance(descendant, IndividualElement) or not isinstance(ancestor, IndividualElement):
             raise NotAnActualIndividualError(
@@ -387,14 +529,25 @@ class Parser:
         if not path:
             path = [descendant]
 
-        if path[-1].get_pointer() == ancestor.get_pointer():
-            return path
-
-        parents = self.get_parents(descendant)
-        for parent in parents:
-            potential_path = self.find_path_to_ancestor(parent, ancestor, path + [parent])
-            if potential_path is not None:
-                return potential_path
+        ancestor_pointer = ancestor.get_pointer()
+        # Maps the pointer of every individual reached so far to the child it was reached from
+        reached_from: dict[str, IndividualElement | None] = {descendant.get_pointer(): None}
+        queue = deque([descendant])
+
+        while queue:
+            current = queue.popleft()
+            if current.get_pointer() == ancestor_pointer:
+                found = []
+                while current is not None:
+                    found.append(current)
+                    current = reached_from[current.get_pointer()]
+                found.reverse()
+                return path + found[1:]
+
+            for parent in self.get_parents(current):
+                if isinstance(parent, IndividualElement) and parent.get_pointer() not in reached_from:
+                    reached_from[parent.get_pointer()] = current
+                    queue.append(parent)
 
         return None
 